@@ -3,7 +3,7 @@ COMPLETE WEBSITE CHATBOT - ALL IN ONE FILE
 ===========================================
 
 This file contains EVERYTHING:
-- Web scraping with BeautifulSoup
+- Web scraping with selectolax
 - Groq AI integration
 - Streamlit frontend
 
@@ -11,7 +11,7 @@ Created for Relinns Technologies Assessment
 
 HOW TO RUN:
 1. Install requirements:
-   pip install streamlit groq beautifulsoup4 requests lxml
+   pip install streamlit groq selectolax requests
 
 2. Run the app:
    streamlit run complete_app.py
@@ -22,14 +22,75 @@ HOW TO RUN:
 4. Enter API key, scrape website, ask questions!
 """
 
+import hashlib
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 from groq import Groq
 
 
 # ==================== BACKEND FUNCTIONS ====================
 
+# Stop downloading a page after this many bytes - bounds memory and
+# parse time on huge pages (content is token-capped later anyway)
+MAX_BYTES = 2_000_000
+
+# Roughly how many tokens of scraped content to hand the model,
+# leaving headroom for instructions, chat history and the reply
+TOKEN_BUDGET = 6000
+
+# Shared HTTP session: keep-alive + pooled connections + retries on
+# transient failures, instead of a fresh socket setup per scrape
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate, br',
+})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Constant system prompt - kept byte-identical across turns so
+# prefix-caching inference engines can reuse the KV cache for the
+# instructions + website-content prefill on every follow-up question
+SYSTEM_INSTRUCTIONS = """You are a helpful AI assistant answering questions about websites.
+You will be given the scraped text content of a website.
+
+INSTRUCTIONS:
+- Answer using ONLY the website content provided
+- If info is not available, say "I don't see that information on this website"
+- Be helpful, accurate, and concise
+- Provide specific details from the website
+- Format answers clearly with proper paragraphs
+- Don't make up information"""
+
+def _key_hash(api_key):
+    """Short digest of an API key, safe to use as a cache key"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+@st.cache_resource(show_spinner=False)
+def get_groq_client(key_hash, _api_key):
+    """
+    Build (and reuse) a Groq client for the given API key
+
+    Cached so the underlying httpx client and its connection pool are
+    shared across reruns and sessions instead of being re-created.
+    The _api_key arg is excluded from hashing; key_hash stands in for it.
+    """
+    return Groq(api_key=_api_key)
+
+
 def test_groq_api(api_key):
     """
     Test if Groq API key is valid
@@ -47,8 +108,9 @@ def test_groq_api(api_key):
         }
     
     try:
-        client = Groq(api_key=api_key.strip())
-        
+        api_key = api_key.strip()
+        client = get_groq_client(_key_hash(api_key), api_key)
+
         # Make a simple test call
         response = client.chat.completions.create(
             model="llama-3.3-70b-versatile",
@@ -75,6 +137,107 @@ def test_groq_api(api_key):
             }
 
 
+# Boilerplate elements removed before extraction
+STRIP_TAGS = ['script', 'style', 'nav', 'footer', 'header']
+
+# Precompiled normalizers: collapse whitespace runs per extracted
+# node, and break lines at sentence ends in the final buffer
+WS = re.compile(r'\s+')
+SENTENCE_END = re.compile(r'\.\s+')
+
+# Tag name -> (minimum text length, output format) - one table drives
+# the whole extraction loop with a single dict lookup per node
+RULES = {
+    'h1': (3, '\n{}'),
+    'h2': (3, '\n{}'),
+    'h3': (3, '\n{}'),
+    'h4': (3, '\n{}'),
+    'p': (30, '{}'),
+    'li': (10, '• {}'),
+}
+
+# Extraction query, built once at import from the RULES table so the
+# selector and the dispatch can never drift apart
+CONTENT_SELECTOR = ','.join(RULES)
+
+
+def estimate_tokens(text):
+    """Cheap token-count estimate (~4 chars per token for web text)"""
+    return len(text) // 4 + text.count(' ') // 4
+
+
+def _extract_content(body):
+    """
+    Parse downloaded HTML bytes and extract readable text
+
+    Args:
+        body: Raw HTML bytes
+
+    Returns:
+        dict: {'success': bool, 'message': str, 'content': str}
+    """
+    # Parse HTML (selectolax wraps the lexbor C parser - no Python
+    # object per node, so parse + extract is much faster than BS4)
+    tree = HTMLParser(body)
+
+    # Remove unwanted elements - one C-side pass that both unlinks
+    # and frees the subtrees, no Python loop over matched nodes
+    tree.strip_tags(STRIP_TAGS)
+
+    # Extract text into one growing buffer - no intermediate list of
+    # pieces plus a join copy of the whole thing
+    buf = io.StringIO()
+
+    # Get title
+    title = tree.css_first('title')
+    if title:
+        title_text = title.text(strip=True)
+        if title_text:
+            buf.write(f"TITLE: {WS.sub(' ', title_text)}\n\n")
+
+    # Get meta description (first match only - templated pages often
+    # carry duplicates)
+    meta = tree.css_first('meta[name=description]')
+    if meta:
+        content = meta.attributes.get('content')
+        if content:
+            buf.write(f"DESCRIPTION: {WS.sub(' ', content.strip())}\n\n")
+
+    # Get headings, paragraphs and list items in a single walk,
+    # driven by the RULES table
+    for node in tree.css(CONTENT_SELECTOR):
+        min_len, fmt = RULES[node.tag]
+        text = WS.sub(' ', node.text(separator=' ', strip=True))
+        if len(text) > min_len:
+            buf.write(fmt.format(text))
+            buf.write('\n\n')
+
+    # Clean text (each piece is already normalized, so no whole-buffer
+    # re-split is needed; just break at sentence ends)
+    website_text = SENTENCE_END.sub('.\n', buf.getvalue().rstrip('\n'))
+
+    # Limit size by token budget - that is the constraint the model
+    # actually enforces, unlike a raw character count
+    if estimate_tokens(website_text) > TOKEN_BUDGET:
+        while estimate_tokens(website_text) > TOKEN_BUDGET:
+            website_text = website_text[:int(len(website_text) * 0.9)]
+        website_text += "\n\n[Content truncated...]"
+
+    # Validate content
+    if not website_text or len(website_text) < 200:
+        return {
+            'success': False,
+            'message': "Could not extract enough content. Try a different URL.",
+            'content': ""
+        }
+
+    return {
+        'success': True,
+        'message': f"Successfully scraped! Extracted {len(website_text)} characters.",
+        'content': website_text
+    }
+
+
 def scrape_website(url):
     """
     Download and extract text from a website
@@ -91,81 +254,16 @@ def scrape_website(url):
             url = 'https://' + url
         
         # Download website
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        
-        # Extract text
-        all_text = []
-        
-        # Get title
-        if soup.title and soup.title.string:
-            all_text.append(f"TITLE: {soup.title.string.strip()}")
-        
-        # Get meta description
-        try:
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags:
-                if isinstance(meta, Tag):
-                    if meta.get('name') == 'description':
-                        content = meta.get('content')
-                        if content:
-                            all_text.append(f"DESCRIPTION: {str(content).strip()}")
-                            break
-        except:
-            pass  # Skip if meta description not found
-        
-        # Get headings
-        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-            text = heading.get_text(strip=True)
-            if text and len(text) > 3:
-                all_text.append(f"\n{text}")
-        
-        # Get paragraphs
-        for paragraph in soup.find_all('p'):
-            text = paragraph.get_text(strip=True)
-            if text and len(text) > 30:
-                all_text.append(text)
-        
-        # Get list items
-        for item in soup.find_all('li'):
-            text = item.get_text(strip=True)
-            if text and len(text) > 10:
-                all_text.append(f"• {text}")
-        
-        # Combine and clean text
-        website_text = "\n\n".join(all_text)
-        website_text = ' '.join(website_text.split())
-        website_text = website_text.replace('. ', '.\n')
-        
-        # Limit size
-        if len(website_text) > 15000:
-            website_text = website_text[:15000] + "\n\n[Content truncated...]"
-        
-        # Validate content
-        if not website_text or len(website_text) < 200:
-            return {
-                'success': False,
-                'message': "Could not extract enough content. Try a different URL.",
-                'content': ""
-            }
-        
-        return {
-            'success': True,
-            'message': f"Successfully scraped! Extracted {len(website_text)} characters.",
-            'content': website_text
-        }
-        
+        with SESSION.get(url, stream=True, timeout=15) as response:
+            response.raise_for_status()
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body.extend(chunk)
+                if len(body) >= MAX_BYTES:
+                    break
+
+        return _extract_content(bytes(body))
+
     except requests.exceptions.Timeout:
         return {
             'success': False,
@@ -186,51 +284,144 @@ def scrape_website(url):
         }
 
 
+def scrape_multiple_websites(urls, max_workers=8):
+    """
+    Download and extract text from several websites in parallel
+
+    Each worker runs the normal scrape_website path on the shared
+    SESSION, so while one page is being parsed the others are still
+    downloading - the GIL is released during socket I/O.
+
+    Args:
+        urls: List of website URLs
+
+    Returns:
+        dict: url -> {'success': bool, 'message': str, 'content': str}
+    """
+    urls = [url if url.startswith('http') else 'https://' + url for url in urls]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(scrape_website, urls)))
+
+
+class ScrapeFailure(Exception):
+    """Raised inside _scrape_cached so failed scrapes are never cached"""
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _scrape_cached(url):
+    """Cached wrapper around scrape_website - repeat URLs skip the
+    download and parse entirely for an hour. Failures are raised
+    rather than returned so st.cache_data never stores them - a
+    transient timeout must not poison the URL for the whole TTL."""
+    result = scrape_website(url)
+    if not result['success']:
+        raise ScrapeFailure(result['message'])
+    return result
+
+
+def heuristic_summary(old_messages, max_chars=3000):
+    """
+    Fold older chat messages into a short bullet list without an extra
+    LLM call: one bullet per message, first sentence only, capped.
+    Bullets from an earlier summary message are carried forward, so
+    repeated compaction keeps accumulating facts instead of
+    re-truncating the previous summary down to one line - but the
+    rebuilt list is itself capped at max_chars, dropping the oldest
+    bullets first, so the summary stays bounded however long the
+    session runs.
+    """
+    bullets = []
+    for msg in old_messages:
+        if msg['role'] == 'system':
+            # An earlier summary produced here - keep its bullets as-is
+            bullets.extend(
+                line for line in msg['content'].splitlines()
+                if line.startswith('- ')
+            )
+            continue
+        speaker = "User asked" if msg['role'] == 'user' else "Bot answered"
+        sentences = re.split(r'(?<=[.!?])\s+', msg['content'].strip())
+        if sentences and sentences[0]:
+            bullets.append(f"- {speaker}: {sentences[0][:200]}")
+
+    # Enforce the cap newest-first: recent facts survive, oldest fall off
+    kept = []
+    total = 0
+    for line in reversed(bullets):
+        total += len(line) + 1
+        if total > max_chars:
+            break
+        kept.append(line)
+    kept.reverse()
+    return "Summary of earlier conversation:\n" + "\n".join(kept)
+
+
+def maybe_summarize(history, max_chars=6000, keep_last=4):
+    """
+    Keep chat history under a character budget
+
+    Returns the history unchanged while it fits in max_chars. Once it
+    is over budget, everything older than the last keep_last messages
+    is collapsed into a single system summary message - itself capped
+    at half of max_chars - so long sessions keep paying for a bounded
+    summary instead of the full transcript, and old context isn't
+    dropped outright.
+    """
+    if sum(len(m['content']) for m in history) <= max_chars:
+        return history
+
+    old, recent = history[:-keep_last], history[-keep_last:]
+    if not old:
+        return recent
+    summary = heuristic_summary(old, max_chars=max_chars // 2)
+    return [{'role': 'system', 'content': summary}] + recent
+
+
+class AskGroqError(Exception):
+    """
+    Raised by ask_groq when a completion fails; the message is
+    user-facing. Failures are raised rather than yielded so a caller
+    can't mistake an error string - or a partial answer with one
+    appended mid-stream - for a real reply.
+    """
+
+
 def ask_groq(groq_client, website_url, website_content, question, chat_history):
     """
-    Ask Groq AI a question about the website
-    
+    Ask Groq AI a question about the website, streaming the answer
+
     Args:
         groq_client: Initialized Groq client
         website_url: URL of the website
         website_content: Scraped content
         question: User's question
         chat_history: Previous conversation
-        
-    Returns:
-        dict: {'success': bool, 'answer': str}
+
+    Yields:
+        str: pieces of the answer as the model generates them
+
+    Raises:
+        AskGroqError: if the question is empty or the call fails
+                      (possibly after some pieces were yielded)
     """
     if not question or len(question.strip()) == 0:
-        return {
-            'success': False,
-            'answer': "Please enter a valid question."
-        }
-    
+        raise AskGroqError("Please enter a valid question.")
+
     try:
-        # Build messages
+        # Build messages. The instructions and content come first, in
+        # the same byte-identical form every turn, so the server-side
+        # prompt cache skips re-prefilling them; the URL lives in its
+        # own message because it can change independently
         messages = [
-            {
-                "role": "system",
-                "content": f"""You are a helpful AI assistant answering questions about websites.
-
-WEBSITE URL: {website_url}
-
-WEBSITE CONTENT:
-{website_content}
-
-INSTRUCTIONS:
-- Answer using ONLY the website content above
-- If info is not available, say "I don't see that information on this website"
-- Be helpful, accurate, and concise
-- Provide specific details from the website
-- Format answers clearly with proper paragraphs
-- Don't make up information"""
-            }
+            {"role": "system", "content": SYSTEM_INSTRUCTIONS},
+            {"role": "system", "content": f"WEBSITE CONTENT:\n{website_content}"},
+            {"role": "system", "content": f"WEBSITE URL: {website_url}"},
         ]
-        
-        # Add recent chat history
+
+        # Add chat history (older turns folded into a summary if long)
         if len(chat_history) > 0:
-            messages.extend(chat_history[-4:])
+            messages.extend(maybe_summarize(chat_history))
         
         # Add current question
         messages.append({
@@ -238,33 +429,61 @@ INSTRUCTIONS:
             "content": question
         })
         
-        # Call Groq API
-        response = groq_client.chat.completions.create(
+        # Call Groq API and yield tokens as they arrive, so the UI can
+        # render the answer while the model is still generating
+        stream = groq_client.chat.completions.create(
             model="llama-3.3-70b-versatile",
             messages=messages,
             max_tokens=800,
-            temperature=0.7
+            temperature=0.7,
+            stream=True
         )
-        
-        # Get answer
-        answer = response.choices[0].message.content.strip()
-        
-        return {
-            'success': True,
-            'answer': answer
-        }
-        
+
+        for chunk in stream:
+            yield chunk.choices[0].delta.content or ""
+
     except Exception as e:
         error_msg = str(e)
         if "authentication" in error_msg.lower():
             error_msg = "Invalid API key. Please check your key."
         elif "rate limit" in error_msg.lower():
             error_msg = "Rate limit exceeded. Please wait and try again."
-        
-        return {
-            'success': False,
-            'answer': f"Error: {error_msg}"
-        }
+
+        raise AskGroqError(error_msg) from e
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_ask(website_url, content_sha, question, _groq_client,
+               _website_content, _slot):
+    """
+    Cached full answer for a canned question
+
+    Keyed on (url, content digest, question); content_sha stands in
+    for the content itself, and the client and output slot are
+    excluded from hashing. Chat history is deliberately not part of
+    the key - the quick questions are answered against the page alone,
+    so a repeat skips the Groq API entirely.
+
+    On a miss the answer streams into _slot as it generates, like the
+    main ask button; on a hit this body is skipped and the caller
+    renders the stored string. Failures raise out of ask_groq before
+    the return, so errors and truncated answers are never cached.
+    """
+    answer = ""
+    for piece in ask_groq(
+        _groq_client, website_url, _website_content, question, []
+    ):
+        answer += piece
+        _slot.markdown(
+            f'<div class="bot-msg"><b>🤖 Bot:</b><br>{answer}</div>',
+            unsafe_allow_html=True
+        )
+    return answer
+
+
+def _content_sha(content):
+    """Short digest of scraped content, used as a cache key"""
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
 
 # ==================== STREAMLIT FRONTEND ====================
@@ -333,6 +552,9 @@ if 'website_scraped' not in st.session_state:
 if 'website_content' not in st.session_state:
     st.session_state.website_content = ""
 
+if 'content_sha' not in st.session_state:
+    st.session_state.content_sha = ""
+
 if 'website_url' not in st.session_state:
     st.session_state.website_url = ""
 
@@ -370,7 +592,9 @@ with st.sidebar:
                 with st.spinner("Validating..."):
                     result = test_groq_api(api_key_input)
                     if result['success']:
-                        st.session_state.groq_client = Groq(api_key=api_key_input)
+                        st.session_state.groq_client = get_groq_client(
+                            _key_hash(api_key_input), api_key_input
+                        )
                         st.session_state.api_validated = True
                         st.success(result['message'])
                     else:
@@ -400,11 +624,15 @@ with st.sidebar:
             st.warning("⚠️ Enter a URL")
         else:
             with st.spinner(f"Scraping {url_input}..."):
-                result = scrape_website(url_input)
-                
+                try:
+                    result = _scrape_cached(url_input)
+                except ScrapeFailure as e:
+                    result = {'success': False, 'message': str(e), 'content': ""}
+
                 if result['success']:
                     st.session_state.website_scraped = True
                     st.session_state.website_content = result['content']
+                    st.session_state.content_sha = _content_sha(result['content'])
                     st.session_state.website_url = url_input
                     st.session_state.messages = []
                     st.session_state.chat_history = []
@@ -412,9 +640,48 @@ with st.sidebar:
                 else:
                     st.session_state.website_scraped = False
                     st.error(result['message'])
-    
+
+    # Optional: scrape several pages at once
+    with st.expander("📚 Batch Scrape (multiple URLs)"):
+        multi_url_input = st.text_area(
+            "One URL per line",
+            placeholder="https://example.com\nhttps://example.com/pricing"
+        )
+        if st.button("🌐 Scrape All", use_container_width=True):
+            urls = [u.strip() for u in multi_url_input.splitlines() if u.strip()]
+            if not st.session_state.api_validated:
+                st.error("❌ Validate API key first!")
+            elif not urls:
+                st.warning("⚠️ Enter at least one URL")
+            else:
+                with st.spinner(f"Scraping {len(urls)} pages..."):
+                    results = scrape_multiple_websites(urls)
+
+                pages = []
+                for url, result in results.items():
+                    if result['success']:
+                        pages.append(f"PAGE: {url}\n\n{result['content']}")
+                    else:
+                        st.warning(f"{url}: {result['message']}")
+
+                if pages:
+                    st.session_state.website_scraped = True
+                    st.session_state.website_content = "\n\n".join(pages)
+                    st.session_state.content_sha = _content_sha(
+                        st.session_state.website_content
+                    )
+                    st.session_state.website_url = ", ".join(
+                        url for url, result in results.items() if result['success']
+                    )
+                    st.session_state.messages = []
+                    st.session_state.chat_history = []
+                    st.success(f"Scraped {len(pages)} of {len(urls)} pages!")
+                else:
+                    st.session_state.website_scraped = False
+                    st.error("Could not scrape any of the URLs.")
+
     st.divider()
-    
+
     # Actions
     st.subheader("🔧 Quick Actions")
     
@@ -562,31 +829,47 @@ else:
             "content": question
         })
         
-        # Get AI response
-        with st.spinner("🤔 AI is thinking..."):
-            result = ask_groq(
+        # Stream the AI response into a placeholder as tokens arrive
+        placeholder = st.empty()
+        answer = ""
+        failed = False
+        try:
+            for piece in ask_groq(
                 st.session_state.groq_client,
                 st.session_state.website_url,
                 st.session_state.website_content,
                 question,
                 st.session_state.chat_history
+            ):
+                answer += piece
+                placeholder.markdown(
+                    f'<div class="bot-msg"><b>🤖 Bot:</b><br>{answer}</div>',
+                    unsafe_allow_html=True
+                )
+        except AskGroqError as e:
+            failed = True
+            answer = f"{answer}\n\n[Error: {e}]" if answer else f"Error: {e}"
+            placeholder.markdown(
+                f'<div class="bot-msg"><b>🤖 Bot:</b><br>{answer}</div>',
+                unsafe_allow_html=True
             )
-            
-            # Add bot response
-            st.session_state.messages.append({
-                "role": "assistant",
-                "content": result['answer']
-            })
-            
-            # Update chat history
-            if result['success']:
-                st.session_state.chat_history.append({"role": "user", "content": question})
-                st.session_state.chat_history.append({"role": "assistant", "content": result['answer']})
-                
-                # Keep history manageable
-                if len(st.session_state.chat_history) > 8:
-                    st.session_state.chat_history = st.session_state.chat_history[-8:]
-        
+
+        # Add bot response
+        st.session_state.messages.append({
+            "role": "assistant",
+            "content": answer
+        })
+
+        # Update chat history (skip failed calls)
+        if not failed:
+            st.session_state.chat_history.append({"role": "user", "content": question})
+            st.session_state.chat_history.append({"role": "assistant", "content": answer})
+
+            # Keep history manageable (summarize instead of dropping)
+            st.session_state.chat_history = maybe_summarize(
+                st.session_state.chat_history
+            )
+
         st.rerun()
     
     st.divider()
@@ -605,6 +888,10 @@ else:
         "Tell me about the company"
     ]
     
+    # Placeholder below the button grid so streamed answers get the
+    # full page width
+    quick_answer_slot = st.empty()
+
     for idx, q in enumerate(quick_questions):
         col = [col1, col2, col3][idx % 3]
         with col:
@@ -614,28 +901,40 @@ else:
                     "role": "user",
                     "content": q
                 })
-                
-                # Get response
-                result = ask_groq(
-                    st.session_state.groq_client,
-                    st.session_state.website_url,
-                    st.session_state.website_content,
-                    q,
-                    st.session_state.chat_history
+
+                # Cached per (url, content, question): a repeat of a
+                # canned question skips the Groq API entirely and
+                # paints instantly; a miss streams into the slot while
+                # the answer generates
+                failed = False
+                try:
+                    answer = cached_ask(
+                        st.session_state.website_url,
+                        st.session_state.content_sha,
+                        q,
+                        st.session_state.groq_client,
+                        st.session_state.website_content,
+                        quick_answer_slot
+                    )
+                except AskGroqError as e:
+                    failed = True
+                    answer = f"Error: {e}"
+                quick_answer_slot.markdown(
+                    f'<div class="bot-msg"><b>🤖 Bot:</b><br>{answer}</div>',
+                    unsafe_allow_html=True
                 )
-                
+
                 # Add bot response
                 st.session_state.messages.append({
                     "role": "assistant",
-                    "content": result['answer']
+                    "content": answer
                 })
-                
-                # Update history
-                if result['success']:
+
+                # Update history (skip failed calls - they also raised
+                # out of cached_ask, so nothing bad was cached)
+                if not failed:
                     st.session_state.chat_history.append({"role": "user", "content": q})
-                    st.session_state.chat_history.append({"role": "assistant", "content": result['answer']})
-                
-                st.rerun()
+                    st.session_state.chat_history.append({"role": "assistant", "content": answer})
 
 # Footer
 st.divider()
@@ -644,7 +943,7 @@ st.markdown("""
     <p>🤖 Powered by <b>Groq AI</b> (Llama 3.3 70B) | Built with <b>Streamlit</b> & <b>Python</b></p>
     <p>Created for <b>Relinns Technologies</b> Assessment</p>
     <p style='font-size: 0.9rem; margin-top: 0.5rem;'>
-        Web Scraping: BeautifulSoup | AI Model: Llama 3.3 70B | Framework: Streamlit
+        Web Scraping: selectolax | AI Model: Llama 3.3 70B | Framework: Streamlit
     </p>
 </div>
 """, unsafe_allow_html=True)
\ No newline at end of file